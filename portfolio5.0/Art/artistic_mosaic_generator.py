@@ -2,15 +2,39 @@
 """
 Artistic Mosaic Generator
 Creates beautiful mosaic art from images using colored tiles or pixel blocks.
+
+Run with --serve to keep a pool of warm generator processes behind a local
+HTTP API instead of paying startup costs on every render.
 """
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image, ImageDraw, ImageFilter, UnidentifiedImageError
 import argparse
+import io
+import json
 import os
-from typing import Tuple, List
+import queue
+import signal
+import socket
+import socketserver
+import stat
+import threading
+import time
+import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple, List, Optional
+from urllib.parse import urlparse, parse_qs
 import colorsys
 
+STYLES = ['basic', 'circular', 'hexagonal', 'gradient', 'pixelated']
+PALETTES = ['vibrant', 'pastel', 'monochrome', 'rainbow']
+OUTPUT_FORMATS = ['PNG', 'JPEG', 'WEBP']
+MAX_TILE_SIZE = 256
+MAX_CACHED_GENERATORS = 8
+
 
 class MosaicGenerator:
     """Generate artistic mosaics from images."""
@@ -26,6 +50,7 @@ class MosaicGenerator:
         self.tile_size = tile_size
         self.color_palette = color_palette
         self.palette_colors = self._generate_palette()
+        self._palette_array = np.array(self.palette_colors, dtype=np.int32)
 
     def _generate_palette(self) -> List[Tuple[int, int, int]]:
         """Generate color palette based on selected style."""
@@ -58,16 +83,8 @@ class MosaicGenerator:
 
     def _find_closest_color(self, color: Tuple[int, int, int]) -> Tuple[int, int, int]:
         """Find the closest color in the palette."""
-        min_distance = float('inf')
-        closest_color = self.palette_colors[0]
-
-        for palette_color in self.palette_colors:
-            distance = sum((c1 - c2) ** 2 for c1, c2 in zip(color, palette_color))
-            if distance < min_distance:
-                min_distance = distance
-                closest_color = palette_color
-
-        return closest_color
+        distances = ((self._palette_array - np.array(color, dtype=np.int32)) ** 2).sum(axis=1)
+        return self.palette_colors[int(distances.argmin())]
 
     def _get_average_color(self, image: Image.Image, x: int, y: int) -> Tuple[int, int, int]:
         """Get the average color of a tile region."""
@@ -269,23 +286,589 @@ class MosaicGenerator:
 
         return mosaic
 
+    def render(self, image: Image.Image, style: str = 'basic', blur: bool = False) -> Image.Image:
+        """
+        Generate a mosaic in the given style.
+
+        Args:
+            image: Input PIL Image
+            style: Mosaic style ('basic', 'circular', 'hexagonal', 'gradient', 'pixelated')
+            blur: Apply blur (pixelated style only)
+
+        Returns:
+            Mosaic image
+        """
+        if style == 'basic':
+            return self.generate_basic_mosaic(image)
+        elif style == 'circular':
+            return self.generate_circular_mosaic(image)
+        elif style == 'hexagonal':
+            return self.generate_hexagonal_mosaic(image)
+        elif style == 'gradient':
+            return self.generate_gradient_mosaic(image)
+        elif style == 'pixelated':
+            return self.generate_pixelated_mosaic(image, blur=blur)
+        raise ValueError(f"Unknown style: {style}")
+
+
+# Warm generators for the current worker process, keyed by (tile_size, palette)
+_worker_generators: "OrderedDict[Tuple[int, str], MosaicGenerator]" = OrderedDict()
+
+
+class ImageDecodeError(Exception):
+    """Raised when request bytes cannot be decoded as an image."""
+
+
+def _init_worker(tile_size: int):
+    """Preload a generator for every palette when a worker process starts."""
+    # Ctrl+C reaches the whole process group; let the parent shut the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for palette in PALETTES:
+        _worker_generators[(tile_size, palette)] = MosaicGenerator(tile_size, palette)
+
+
+def _get_generator(tile_size: int, palette: str) -> MosaicGenerator:
+    """Return a cached generator, evicting the least recently used one when full."""
+    key = (tile_size, palette)
+    if key in _worker_generators:
+        _worker_generators.move_to_end(key)
+    else:
+        _worker_generators[key] = MosaicGenerator(tile_size, palette)
+        if len(_worker_generators) > MAX_CACHED_GENERATORS:
+            _worker_generators.popitem(last=False)
+    return _worker_generators[key]
+
+
+def _render_bytes(image_bytes: bytes, style: str, tile_size: int, palette: str,
+                  blur: bool, output_format: str) -> bytes:
+    """Decode, render and encode one mosaic inside a worker process."""
+    try:
+        image = Image.open(io.BytesIO(image_bytes)).convert('RGB')
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise ImageDecodeError(str(e)) from e
+    mosaic = _get_generator(tile_size, palette).render(image, style, blur=blur)
+    output = io.BytesIO()
+    mosaic.save(output, format=output_format, quality=95)
+    return output.getvalue()
+
+
+def _render_batch(tile_size: int, palette: str,
+                  requests: List[Tuple[bytes, str, bool, str]]) -> List[Tuple[Optional[bytes], int]]:
+    """
+    Render several jobs sharing a generator in one worker round-trip.
+
+    Returns:
+        A (result, status) pair per request; result is None unless status is 200
+    """
+    results = []
+    for image_bytes, style, blur, output_format in requests:
+        try:
+            results.append((_render_bytes(image_bytes, style, tile_size, palette,
+                                          blur, output_format), 200))
+        except ImageDecodeError:
+            results.append((None, 422))
+        except Exception:
+            traceback.print_exc()
+            results.append((None, 500))
+    return results
+
+
+def _ping() -> int:
+    """No-op task used to make sure a worker process has started."""
+    return os.getpid()
+
+
+class RenderJob:
+    """A single render request waiting in the server queue."""
+
+    def __init__(self, image_bytes: bytes, style: str, tile_size: int,
+                 palette: str, blur: bool, output_format: str):
+        self.image_bytes = image_bytes
+        self.style = style
+        self.tile_size = tile_size
+        self.palette = palette
+        self.blur = blur
+        self.output_format = output_format
+        self.submitted = time.monotonic()
+        self.done = threading.Event()
+        self.cancelled = False
+        self.result: Optional[bytes] = None
+        self.error: Optional[str] = None
+        self.error_status = 500
+
+    @property
+    def generator_key(self) -> Tuple[int, str]:
+        return (self.tile_size, self.palette)
+
+
+ERROR_MESSAGES = {
+    422: 'could not decode image',
+    500: 'render failed',
+}
+
+
+class MosaicServer:
+    """
+    Queue render jobs and run them on a pool of warm worker processes.
+
+    Rendering is CPU-bound Python, so each worker is a separate process with
+    its own generators. One dispatcher thread per process feeds it jobs from
+    the queue. When the queue backs up past what the other workers can take,
+    a dispatcher pulls extra jobs and sends those sharing a (tile_size,
+    palette) to its process in a single call.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 64, tile_size: int = 20,
+                 batch_size: int = 4, max_upload_bytes: int = 25 * 1024 * 1024,
+                 max_pixels: int = 40_000_000, max_tiles: int = 250_000,
+                 timeout: float = 120.0):
+        """
+        Initialize the render server.
+
+        Args:
+            workers: Number of worker processes
+            max_queue: Maximum number of pending jobs before rejecting requests
+            tile_size: Tile size to preload generators for
+            batch_size: Maximum number of jobs sent to a worker in one call
+            max_upload_bytes: Largest accepted request body
+            max_pixels: Largest accepted image in pixels
+            max_tiles: Largest accepted number of tiles per render
+            timeout: Seconds a request waits for its render before giving up
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.workers = workers
+        self.tile_size = tile_size
+        self.batch_size = batch_size
+        self.max_upload_bytes = max_upload_bytes
+        self.max_pixels = max_pixels
+        self.max_tiles = max_tiles
+        self.timeout = timeout
+        self.jobs: "queue.Queue[Optional[RenderJob]]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._latencies: deque = deque(maxlen=1000)
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._batches = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._threads: List[threading.Thread] = []
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.tile_size,))
+
+    def start(self):
+        """Start the worker processes and their dispatcher threads."""
+        self._pool = self._new_pool()
+        # Start every worker now so palettes are loaded before the first request
+        wait([self._pool.submit(_ping) for _ in range(self.workers)])
+
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._dispatch, name=f"mosaic-dispatch-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop the dispatcher threads and shut down the worker processes."""
+        for _ in self._threads:
+            self.jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def check_size(self, width: int, height: int, tile_size: int) -> Optional[str]:
+        """Return an error message if an image is too costly to render."""
+        if width * height > self.max_pixels:
+            return f"image exceeds {self.max_pixels} pixels"
+        if (width // tile_size) * (height // tile_size) > self.max_tiles:
+            return f"image exceeds {self.max_tiles} tiles at tile_size {tile_size}"
+        return None
+
+    def submit(self, job: RenderJob) -> bool:
+        """Queue a job, returning False if the queue is full."""
+        try:
+            self.jobs.put_nowait(job)
+        except queue.Full:
+            return False
+        return True
+
+    def cancel(self, job: RenderJob):
+        """Mark a timed out job so it is skipped or left uncounted."""
+        with self._lock:
+            job.cancelled = True
+            self._timed_out += 1
+
+    def _take_batch(self, first: RenderJob) -> List[RenderJob]:
+        """Pull extra queued jobs, leaving enough for the other workers."""
+        batch = [first]
+        # Only batch when the backlog exceeds one job per worker, so idle
+        # workers are never starved by a single dispatcher
+        extra = min(self.batch_size - 1, self.jobs.qsize() // self.workers)
+        for _ in range(extra):
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                # Stop sentinel; put it back for this or another dispatcher
+                self.jobs.put(None)
+                break
+            batch.append(job)
+        return batch
+
+    def _dispatch(self):
+        """Hand queued jobs to the process pool, grouped by generator."""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+
+            batch = self._take_batch(job)
+            with self._lock:
+                skipped = [job for job in batch if job.cancelled]
+                batch = [job for job in batch if not job.cancelled]
+                self._in_flight += len(batch)
+            for job in skipped:
+                job.done.set()
+
+            groups: "OrderedDict[Tuple[int, str], List[RenderJob]]" = OrderedDict()
+            for job in batch:
+                groups.setdefault(job.generator_key, []).append(job)
+            for group in groups.values():
+                try:
+                    self._run(group)
+                finally:
+                    with self._lock:
+                        self._in_flight -= len(group)
+                    for job in group:
+                        job.done.set()
+
+    def _run(self, group: List[RenderJob]):
+        """Render jobs sharing a generator in one worker call and record them."""
+        pool = self._pool
+        tile_size, palette = group[0].generator_key
+        requests = [(job.image_bytes, job.style, job.blur, job.output_format) for job in group]
+        try:
+            results = pool.submit(_render_batch, tile_size, palette, requests).result()
+        except BrokenProcessPool:
+            results = [(None, 500)] * len(group)
+            self._restart_pool(pool)
+
+        finished = time.monotonic()
+        with self._lock:
+            self._batches += 1
+            for job, (result, status) in zip(group, results):
+                job.result = result
+                if result is None:
+                    job.error_status = status
+                    job.error = ERROR_MESSAGES[status]
+                # Timed out jobs were already counted by cancel()
+                if job.cancelled:
+                    continue
+                if result is None:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                    self._latencies.append(finished - job.submitted)
+
+    def _restart_pool(self, broken: ProcessPoolExecutor):
+        """Replace a pool whose worker process died."""
+        with self._lock:
+            if self._pool is not broken:
+                return
+            self._pool = self._new_pool()
+        broken.shutdown(wait=False)
+
+    def metrics(self) -> dict:
+        """Return queue depth, latency and throughput statistics."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            in_flight = self._in_flight
+            completed = self._completed
+            failed = self._failed
+            timed_out = self._timed_out
+            batches = self._batches
+        uptime = time.monotonic() - self._started
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(p * len(latencies)))
+            return round(latencies[index] * 1000, 2)
+
+        return {
+            'queue_depth': self.jobs.qsize(),
+            'in_flight': in_flight,
+            'workers': self.workers,
+            'completed': completed,
+            'failed': failed,
+            'timed_out': timed_out,
+            'batches': batches,
+            'uptime_seconds': round(uptime, 2),
+            'throughput_per_second': round(completed / uptime, 3) if uptime else 0.0,
+            'latency_ms': {
+                'p50': percentile(0.5),
+                'p95': percentile(0.95),
+                'max': percentile(1.0),
+            },
+        }
+
+
+class MosaicRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API for the render server.
+
+    POST /render?style=basic&tile_size=20&palette=vibrant&blur=0&format=png
+        Body is the raw input image; the response is the encoded mosaic.
+    GET /metrics
+        Queue depth, latency and throughput as JSON.
+    """
+
+    server_version = 'MosaicServer/1.0'
+    chunk_size = 64 * 1024
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/metrics':
+            self._send_json(200, self.server.mosaic.metrics())
+        elif path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        mosaic = self.server.mosaic
+        url = urlparse(self.path)
+        if url.path != '/render':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        style = params.get('style', 'basic')
+        palette = params.get('palette', 'vibrant')
+        output_format = params.get('format', 'png').upper()
+        blur = params.get('blur', '0').lower() in ('1', 'true', 'yes')
+        try:
+            tile_size = int(params.get('tile_size', mosaic.tile_size))
+        except ValueError:
+            self._send_json(400, {'error': 'tile_size must be an integer'})
+            return
+
+        if style not in STYLES:
+            self._send_json(400, {'error': f"style must be one of {STYLES}"})
+            return
+        if palette not in PALETTES:
+            self._send_json(400, {'error': f"palette must be one of {PALETTES}"})
+            return
+        if output_format not in OUTPUT_FORMATS:
+            self._send_json(400, {'error': 'format must be png, jpeg or webp'})
+            return
+        if not 1 <= tile_size <= MAX_TILE_SIZE:
+            self._send_json(400, {'error': f"tile_size must be between 1 and {MAX_TILE_SIZE}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            self._send_json(400, {'error': 'Content-Length must be an integer'})
+            return
+        if length <= 0:
+            self._send_json(400, {'error': 'request body must contain image bytes'})
+            return
+        if length > mosaic.max_upload_bytes:
+            self._send_json(413, {'error': f"request body exceeds {mosaic.max_upload_bytes} bytes"})
+            return
+        image_bytes = self.rfile.read(length)
+
+        # Reading the header is cheap; reject costly renders before queuing them
+        try:
+            width, height = Image.open(io.BytesIO(image_bytes)).size
+        except Image.DecompressionBombError as e:
+            self._send_json(413, {'error': str(e)})
+            return
+        except (UnidentifiedImageError, OSError):
+            self._send_json(422, {'error': ERROR_MESSAGES[422]})
+            return
+        size_error = mosaic.check_size(width, height, tile_size)
+        if size_error is not None:
+            self._send_json(413, {'error': size_error})
+            return
+
+        job = RenderJob(image_bytes, style, tile_size, palette, blur, output_format)
+        if not mosaic.submit(job):
+            self._send_json(503, {'error': 'render queue is full'})
+            return
+        if not job.done.wait(mosaic.timeout):
+            mosaic.cancel(job)
+            self._send_json(504, {'error': 'render timed out'})
+            return
+
+        if job.error is not None:
+            self._send_json(job.error_status, {'error': job.error})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', f"image/{output_format.lower()}")
+        self.send_header('Content-Length', str(len(job.result)))
+        self.end_headers()
+        for start in range(0, len(job.result), self.chunk_size):
+            self.wfile.write(job.result[start:start + self.chunk_size])
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server listening on a Unix domain socket."""
+
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) style client address
+        return request, ('unix', 0)
+
+
+def _is_socket(path: str) -> bool:
+    """Check whether path is an existing Unix socket file."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _socket_in_use(path: str) -> bool:
+    """Check whether a server is still accepting connections on a Unix socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(path)
+        except ConnectionRefusedError:
+            return False
+    return True
+
+
+def serve(args) -> int:
+    """Run the long-lived render server until interrupted."""
+    try:
+        if args.socket:
+            if _is_socket(args.socket):
+                if _socket_in_use(args.socket):
+                    print(f"Error: socket '{args.socket}' is already in use")
+                    return 1
+                # Left behind by a previous server that did not shut down cleanly
+                os.remove(args.socket)
+            elif os.path.lexists(args.socket):
+                print(f"Error: '{args.socket}' exists and is not a socket")
+                return 1
+            httpd = UnixHTTPServer(args.socket, MosaicRequestHandler)
+            address = f"unix:{args.socket}"
+        else:
+            httpd = ThreadingHTTPServer((args.host, args.port), MosaicRequestHandler)
+            address = f"http://{args.host}:{args.port}"
+    except OSError as e:
+        target = args.socket or f"{args.host}:{args.port}"
+        print(f"Error: could not listen on {target}: {e.strerror or e}")
+        return 1
+
+    mosaic = MosaicServer(workers=args.workers, max_queue=args.max_queue, tile_size=args.tile_size,
+                          batch_size=args.batch_size, max_upload_bytes=args.max_upload_mb * 1024 * 1024,
+                          max_pixels=int(args.max_megapixels * 1_000_000), max_tiles=args.max_tiles,
+                          timeout=args.timeout)
+    httpd.mosaic = mosaic
+
+    print(f"Starting {args.workers} worker processes...")
+    mosaic.start()
+    print(f"Serving mosaics on {address}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down...")
+    finally:
+        httpd.server_close()
+        mosaic.stop()
+        if args.socket and _is_socket(args.socket):
+            os.remove(args.socket)
+
+    return 0
+
 
 def main():
     """Main function to run the mosaic generator."""
     parser = argparse.ArgumentParser(description='Generate artistic mosaics from images')
-    parser.add_argument('input', help='Input image path')
+    parser.add_argument('input', nargs='?', help='Input image path')
     parser.add_argument('-o', '--output', help='Output image path (default: input_mosaic.png)')
     parser.add_argument('-t', '--tile-size', type=int, default=20,
                         help='Size of mosaic tiles (default: 20)')
-    parser.add_argument('-s', '--style', choices=['basic', 'circular', 'hexagonal', 'gradient', 'pixelated'],
+    parser.add_argument('-s', '--style', choices=STYLES,
                         default='basic', help='Mosaic style (default: basic)')
-    parser.add_argument('-p', '--palette', choices=['vibrant', 'pastel', 'monochrome', 'rainbow'],
+    parser.add_argument('-p', '--palette', choices=PALETTES,
                         default='vibrant', help='Color palette (default: vibrant)')
     parser.add_argument('--blur', action='store_true',
                         help='Apply blur (pixelated style only)')
 
+    server = parser.add_argument_group('server mode')
+    server.add_argument('--serve', action='store_true',
+                        help='Run a local render server instead of a single render')
+    server.add_argument('--host', default='127.0.0.1',
+                        help='Host to bind (default: 127.0.0.1)')
+    server.add_argument('--port', type=int, default=8765,
+                        help='Port to bind (default: 8765)')
+    server.add_argument('--socket', help='Listen on a Unix socket path instead of TCP')
+    server.add_argument('--workers', type=int, default=2,
+                        help='Number of warm worker processes (default: 2)')
+    server.add_argument('--max-queue', type=int, default=64,
+                        help='Maximum pending jobs before rejecting (default: 64)')
+    server.add_argument('--batch-size', type=int, default=4,
+                        help='Maximum backlogged jobs sent to a worker at once (default: 4)')
+    server.add_argument('--max-upload-mb', type=int, default=25,
+                        help='Largest accepted image upload in MB (default: 25)')
+    server.add_argument('--max-megapixels', type=float, default=40.0,
+                        help='Largest accepted image size in megapixels (default: 40)')
+    server.add_argument('--max-tiles', type=int, default=250_000,
+                        help='Largest accepted number of tiles per render (default: 250000)')
+    server.add_argument('--timeout', type=float, default=120.0,
+                        help='Seconds a request waits for its render (default: 120)')
+
     args = parser.parse_args()
 
+    if args.serve:
+        if args.workers < 1:
+            parser.error('--workers must be at least 1')
+        if args.max_queue < 1:
+            parser.error('--max-queue must be at least 1')
+        if args.batch_size < 1:
+            parser.error('--batch-size must be at least 1')
+        if args.max_upload_mb < 1:
+            parser.error('--max-upload-mb must be at least 1')
+        if args.max_megapixels <= 0:
+            parser.error('--max-megapixels must be positive')
+        if args.max_tiles < 1:
+            parser.error('--max-tiles must be at least 1')
+        if args.timeout <= 0:
+            parser.error('--timeout must be positive')
+        if not 1 <= args.tile_size <= MAX_TILE_SIZE:
+            parser.error(f'--tile-size must be between 1 and {MAX_TILE_SIZE}')
+        return serve(args)
+
+    if args.input is None:
+        parser.error('input is required unless --serve is given')
+
     # Validate input file
     if not os.path.exists(args.input):
         print(f"Error: Input file '{args.input}' not found")
@@ -305,16 +888,7 @@ def main():
     generator = MosaicGenerator(tile_size=args.tile_size, color_palette=args.palette)
 
     # Generate mosaic based on style
-    if args.style == 'basic':
-        mosaic = generator.generate_basic_mosaic(image)
-    elif args.style == 'circular':
-        mosaic = generator.generate_circular_mosaic(image)
-    elif args.style == 'hexagonal':
-        mosaic = generator.generate_hexagonal_mosaic(image)
-    elif args.style == 'gradient':
-        mosaic = generator.generate_gradient_mosaic(image)
-    elif args.style == 'pixelated':
-        mosaic = generator.generate_pixelated_mosaic(image, blur=args.blur)
+    mosaic = generator.render(image, args.style, blur=args.blur)
 
     print(f"Saving mosaic: {output_path}")
     mosaic.save(output_path, quality=95)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for the Artistic Mosaic Generator.
+Run with: python -m unittest test_artistic_mosaic_generator
+"""
+
+import http.client
+import io
+import json
+import os
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from artistic_mosaic_generator import (  # noqa: E402
+    MAX_TILE_SIZE, STYLES, MosaicGenerator, MosaicRequestHandler, MosaicServer, RenderJob,
+    _render_batch,
+)
+
+
+def make_image(width: int = 120, height: int = 80) -> Image.Image:
+    """Create a small two-tone test image."""
+    image = Image.new('RGB', (width, height), (30, 120, 200))
+    image.paste((220, 60, 40), (0, 0, width // 2, height))
+    return image
+
+
+def encode(image: Image.Image) -> bytes:
+    output = io.BytesIO()
+    image.save(output, format='PNG')
+    return output.getvalue()
+
+
+class MosaicGeneratorTest(unittest.TestCase):
+    """Check style dispatch and palette matching."""
+
+    def setUp(self):
+        self.generator = MosaicGenerator(tile_size=10, color_palette='vibrant')
+        self.image = make_image()
+
+    def test_render_dispatches_to_each_style(self):
+        expected = {
+            'basic': self.generator.generate_basic_mosaic(self.image),
+            'circular': self.generator.generate_circular_mosaic(self.image),
+            'hexagonal': self.generator.generate_hexagonal_mosaic(self.image),
+            'gradient': self.generator.generate_gradient_mosaic(self.image),
+            'pixelated': self.generator.generate_pixelated_mosaic(self.image),
+        }
+        self.assertEqual(sorted(expected), sorted(STYLES))
+        for style, mosaic in expected.items():
+            with self.subTest(style=style):
+                rendered = self.generator.render(self.image, style)
+                self.assertEqual(rendered.tobytes(), mosaic.tobytes())
+
+    def test_render_passes_blur_to_pixelated(self):
+        rendered = self.generator.render(self.image, 'pixelated', blur=True)
+        expected = self.generator.generate_pixelated_mosaic(self.image, blur=True)
+        self.assertEqual(rendered.tobytes(), expected.tobytes())
+
+    def test_render_rejects_unknown_style(self):
+        with self.assertRaises(ValueError):
+            self.generator.render(self.image, 'triangular')
+
+    def test_closest_color_matches_brute_force(self):
+        for color in [(0, 0, 0), (250, 10, 10), (100, 100, 100), (64, 192, 0), (128, 64, 255)]:
+            expected = min(self.generator.palette_colors,
+                           key=lambda p: sum((a - b) ** 2 for a, b in zip(color, p)))
+            self.assertEqual(self.generator._find_closest_color(color), expected)
+
+
+class RenderBatchTest(unittest.TestCase):
+    """Check per-job results from a worker batch."""
+
+    def test_reports_status_per_job(self):
+        body = encode(make_image())
+        results = _render_batch(10, 'vibrant', [
+            (body, 'basic', False, 'PNG'),
+            (b'not an image', 'basic', False, 'PNG'),
+            (body, 'basic', False, 'NOT-A-FORMAT'),
+        ])
+        self.assertEqual([status for _, status in results], [200, 422, 500])
+        self.assertIsNotNone(results[0][0])
+        self.assertIsNone(results[1][0])
+        self.assertIsNone(results[2][0])
+
+
+class MosaicServerQueueTest(unittest.TestCase):
+    """Check batching and timeout accounting without the HTTP layer."""
+
+    def make_job(self, image: Image.Image, tile_size: int = 10, style: str = 'basic') -> RenderJob:
+        return RenderJob(encode(image), style, tile_size, 'vibrant', False, 'PNG')
+
+    def test_batches_backlogged_jobs(self):
+        mosaic = MosaicServer(workers=1, max_queue=8, tile_size=10, batch_size=4)
+        jobs = [self.make_job(make_image()) for _ in range(3)]
+        for job in jobs:
+            self.assertTrue(mosaic.submit(job))
+        mosaic.start()
+        self.addCleanup(mosaic.stop)
+
+        for job in jobs:
+            self.assertTrue(job.done.wait(30))
+            self.assertIsNone(job.error)
+        metrics = mosaic.metrics()
+        self.assertEqual(metrics['completed'], 3)
+        self.assertEqual(metrics['batches'], 1)
+        self.assertEqual(metrics['in_flight'], 0)
+
+    def test_timed_out_job_is_not_counted_as_completed(self):
+        mosaic = MosaicServer(workers=1, tile_size=10, timeout=0.01)
+        mosaic.start()
+        self.addCleanup(mosaic.stop)
+
+        job = self.make_job(make_image(400, 400), tile_size=2)
+        self.assertTrue(mosaic.submit(job))
+        self.assertFalse(job.done.wait(mosaic.timeout))
+        mosaic.cancel(job)
+        self.assertTrue(job.done.wait(30))
+
+        metrics = mosaic.metrics()
+        self.assertEqual(metrics['timed_out'], 1)
+        self.assertEqual(metrics['completed'], 0)
+        self.assertEqual(metrics['failed'], 0)
+        self.assertIsNone(metrics['latency_ms']['p50'])
+
+
+class MosaicServerTest(unittest.TestCase):
+    """Round-trip requests through an in-process render server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mosaic = MosaicServer(workers=1, max_queue=4, tile_size=10, max_upload_bytes=1024 * 1024,
+                                  max_tiles=5000)
+        cls.mosaic.start()
+        cls.httpd = ThreadingHTTPServer(('127.0.0.1', 0), MosaicRequestHandler)
+        cls.httpd.mosaic = cls.mosaic
+        cls.thread = threading.Thread(target=cls.httpd.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.httpd.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+        cls.mosaic.stop()
+
+    def post(self, query: str, body: bytes):
+        request = urllib.request.Request(f"{self.base_url}/render?{query}", data=body, method='POST')
+        return urllib.request.urlopen(request)
+
+    def assert_error(self, status: int, query: str, body: bytes):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.post(query, body)
+        self.assertEqual(context.exception.code, status)
+        return json.load(context.exception)
+
+    def test_render_round_trip(self):
+        image = make_image()
+        response = self.post('style=basic&palette=pastel&tile_size=10', encode(image))
+        self.assertEqual(response.headers['Content-Type'], 'image/png')
+        mosaic = Image.open(io.BytesIO(response.read())).convert('RGB')
+
+        expected = MosaicGenerator(tile_size=10, color_palette='pastel').render(image, 'basic')
+        self.assertEqual(mosaic.tobytes(), expected.tobytes())
+
+        metrics = json.load(urllib.request.urlopen(f"{self.base_url}/metrics"))
+        self.assertGreaterEqual(metrics['completed'], 1)
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertEqual(metrics['in_flight'], 0)
+        self.assertEqual(metrics['workers'], 1)
+        self.assertIsNotNone(metrics['latency_ms']['p50'])
+
+    def test_rejects_invalid_parameters(self):
+        body = encode(make_image())
+        self.assert_error(400, 'style=triangular', body)
+        self.assert_error(400, 'palette=neon', body)
+        self.assert_error(400, 'format=gif', body)
+        self.assert_error(400, 'tile_size=abc', body)
+        self.assert_error(400, f"tile_size={MAX_TILE_SIZE + 1}", body)
+
+    def test_rejects_costly_render(self):
+        payload = self.assert_error(413, 'style=basic&tile_size=1', encode(make_image()))
+        self.assertIn('tiles', payload['error'])
+
+    def raw_post(self, content_length: str) -> http.client.HTTPResponse:
+        """Send a render request with a hand-written Content-Length header."""
+        connection = http.client.HTTPConnection('127.0.0.1', self.httpd.server_address[1])
+        self.addCleanup(connection.close)
+        connection.putrequest('POST', '/render?style=basic')
+        connection.putheader('Content-Length', content_length)
+        connection.endheaders()
+        return connection.getresponse()
+
+    def test_rejects_oversized_body(self):
+        response = self.raw_post(str(1024 * 1024 + 1))
+        self.assertEqual(response.status, 413)
+        self.assertIn('exceeds', json.load(response)['error'])
+
+    def test_rejects_malformed_content_length(self):
+        self.assertEqual(self.raw_post('abc').status, 400)
+
+    def test_reports_undecodable_image(self):
+        self.assert_error(422, 'style=basic', b'not an image')
+
+
+if __name__ == '__main__':
+    unittest.main()